@@ -1,11 +1,14 @@
 from typing import Union, Tuple, Any, Optional
 
-import gym
-import gymnasium
-import collections
+import importlib
 import numpy as np
 from packaging import version
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 import torch
 
 from skrl import logger
@@ -13,6 +16,105 @@ from skrl import logger
 __all__ = ["wrap_env"]
 
 
+# default device, computed once to avoid querying the CUDA driver on every instantiation
+_DEFAULT_DEVICE = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+
+
+# gym and gymnasium are imported lazily (on first use) so that consumers of the
+# other wrappers (e.g. Isaac Gym workflows) do not pay their import cost
+gym = None
+gymnasium = None
+_Box = _Dict = _Tuple = _Discrete = _MultiDiscrete = None
+
+def _load_gym() -> None:
+    """Import gym (once) and bind the space classes used by the wrappers
+    """
+    global gym, _Box, _Dict, _Tuple, _Discrete, _MultiDiscrete
+    if gym is None:
+        import gym
+        from gym.spaces import Box as _Box
+        from gym.spaces import Dict as _Dict
+        from gym.spaces import Tuple as _Tuple
+        from gym.spaces import Discrete as _Discrete
+        from gym.spaces import MultiDiscrete as _MultiDiscrete
+
+def _load_gymnasium() -> None:
+    """Import gymnasium (once)
+    """
+    global gymnasium
+    if gymnasium is None:
+        import gymnasium
+
+
+_TYPES_CACHE = {}
+
+def _get_type(name: str) -> Optional[type]:
+    """Import (once) and return a class used for environment auto-detection
+
+    :param name: Fully qualified name of the class
+    :type name: str
+
+    :return: The class reference, or None if its package is not available
+    :rtype: type or None
+    """
+    if name not in _TYPES_CACHE:
+        module_name, class_name = name.rsplit(".", 1)
+        try:
+            _TYPES_CACHE[name] = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            _TYPES_CACHE[name] = None
+    return _TYPES_CACHE[name]
+
+def _is_instance(env: Any, name: str) -> bool:
+    """Whether the environment is an instance of the named class
+
+    :param env: The environment to check
+    :type env: Any
+    :param name: Fully qualified name of the class
+    :type name: str
+
+    :return: False if the class package is not available, the isinstance check otherwise
+    :rtype: bool
+    """
+    klass = _get_type(name)
+    return klass is not None and isinstance(env, klass)
+
+
+def _to_numpy(tensor: torch.Tensor) -> np.ndarray:
+    """Return the tensor data as a numpy array
+
+    CPU tensors are exposed as zero-copy views instead of going through
+    an extra .cpu() wrapper
+
+    :param tensor: The tensor to convert
+    :type tensor: torch.Tensor
+
+    :return: The tensor data as a numpy array
+    :rtype: np.ndarray
+    """
+    tensor = tensor.detach()
+    return tensor.numpy() if tensor.device.type == "cpu" else tensor.cpu().numpy()
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _flatten_leaves(stage: np.ndarray, leaves: tuple, offsets: np.ndarray, sizes: np.ndarray) -> None:
+        """Fill the staging buffer from the flattened observation leaves
+        (JIT-compiled to skip the Python interpreter overhead per leaf)
+        """
+        for i in range(len(leaves)):
+            stage[offsets[i]:offsets[i] + sizes[i]] = leaves[i]
+
+
+@torch.jit.script
+def _reshape_isaac_step(reward: torch.Tensor, terminated: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Reshape the Isaac Gym reward/termination buffers and build the truncation
+    buffer in a single scripted call, skipping the Python-level dispatch
+    """
+    terminated = terminated.view(-1, 1)
+    return reward.view(-1, 1), terminated, torch.zeros_like(terminated)
+
+
 class Wrapper(object):
     def __init__(self, env: Any) -> None:
         """Base wrapper class for RL environments
@@ -26,7 +128,14 @@ class Wrapper(object):
         if hasattr(self._env, "device"):
             self.device = torch.device(self._env.device)
         else:
-            self.device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+            self.device = _DEFAULT_DEVICE
+
+        # materialize commonly accessed environment properties once
+        # (hasattr/getattr chains are measurable at env-step frequency)
+        self._num_envs = self._env.num_envs if hasattr(self._env, "num_envs") else 1
+        self._observation_space = getattr(self._env, "observation_space", None)
+        self._state_space = self._env.state_space if hasattr(self._env, "state_space") else self._observation_space
+        self._action_space = getattr(self._env, "action_space", None)
 
     def __getattr__(self, key: str) -> Any:
         """Get an attribute from the wrapped environment
@@ -87,28 +196,28 @@ class Wrapper(object):
 
         If the wrapped environment does not have the ``num_envs`` property, it will be set to 1
         """
-        return self._env.num_envs if hasattr(self._env, "num_envs") else 1
+        return self._num_envs
 
     @property
-    def state_space(self) -> gym.Space:
+    def state_space(self) -> "gym.Space":
         """State space
 
         If the wrapped environment does not have the ``state_space`` property,
         the value of the ``observation_space`` property will be used
         """
-        return self._env.state_space if hasattr(self._env, "state_space") else self._env.observation_space
+        return self._state_space
 
     @property
-    def observation_space(self) -> gym.Space:
+    def observation_space(self) -> "gym.Space":
         """Observation space
         """
-        return self._env.observation_space
+        return self._observation_space
 
     @property
-    def action_space(self) -> gym.Space:
+    def action_space(self) -> "gym.Space":
         """Action space
         """
-        return self._env.action_space
+        return self._action_space
 
 
 class IsaacGymPreview2Wrapper(Wrapper):
@@ -123,6 +232,13 @@ class IsaacGymPreview2Wrapper(Wrapper):
         self._reset_once = True
         self._obs_buf = None
 
+        # cached 2D views (Isaac Gym reuses the same buffer storage every step)
+        self._reward_view = None
+        self._terminated_view = None
+        self._truncated_buf = None
+        self._reward_ptr = None
+        self._terminated_ptr = None
+
     def step(self, actions: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, Any]:
         """Perform a step in the environment
 
@@ -133,8 +249,11 @@ class IsaacGymPreview2Wrapper(Wrapper):
         :rtype: tuple of torch.Tensor and any other info
         """
         self._obs_buf, reward, terminated, info = self._env.step(actions)
-        truncated = torch.zeros_like(terminated)
-        return self._obs_buf, reward.view(-1, 1), terminated.view(-1, 1), truncated.view(-1, 1), info
+        # refresh the cached views only if the environment reallocated its buffers
+        if reward.data_ptr() != self._reward_ptr or terminated.data_ptr() != self._terminated_ptr:
+            self._reward_ptr, self._terminated_ptr = reward.data_ptr(), terminated.data_ptr()
+            self._reward_view, self._terminated_view, self._truncated_buf = _reshape_isaac_step(reward, terminated)
+        return self._obs_buf, self._reward_view, self._terminated_view, self._truncated_buf, info
 
     def reset(self) -> Tuple[torch.Tensor, Any]:
         """Reset the environment
@@ -170,6 +289,13 @@ class IsaacGymPreview3Wrapper(Wrapper):
         self._reset_once = True
         self._obs_dict = None
 
+        # cached 2D views (Isaac Gym reuses the same buffer storage every step)
+        self._reward_view = None
+        self._terminated_view = None
+        self._truncated_buf = None
+        self._reward_ptr = None
+        self._terminated_ptr = None
+
     def step(self, actions: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, Any]:
         """Perform a step in the environment
 
@@ -180,8 +306,11 @@ class IsaacGymPreview3Wrapper(Wrapper):
         :rtype: tuple of torch.Tensor and any other info
         """
         self._obs_dict, reward, terminated, info = self._env.step(actions)
-        truncated = torch.zeros_like(terminated)
-        return self._obs_dict["obs"], reward.view(-1, 1), terminated.view(-1, 1), truncated.view(-1, 1), info
+        # refresh the cached views only if the environment reallocated its buffers
+        if reward.data_ptr() != self._reward_ptr or terminated.data_ptr() != self._terminated_ptr:
+            self._reward_ptr, self._terminated_ptr = reward.data_ptr(), terminated.data_ptr()
+            self._reward_view, self._terminated_view, self._truncated_buf = _reshape_isaac_step(reward, terminated)
+        return self._obs_dict["obs"], self._reward_view, self._terminated_view, self._truncated_buf, info
 
     def reset(self) -> Tuple[torch.Tensor, Any]:
         """Reset the environment
@@ -237,8 +366,8 @@ class OmniverseIsaacGymWrapper(Wrapper):
         :rtype: tuple of torch.Tensor and any other info
         """
         self._obs_dict, reward, terminated, info = self._env.step(actions)
-        truncated = torch.zeros_like(terminated)
-        return self._obs_dict["obs"], reward.view(-1, 1), terminated.view(-1, 1), truncated.view(-1, 1), info
+        reward, terminated, truncated = _reshape_isaac_step(reward, terminated)
+        return self._obs_dict["obs"], reward, terminated, truncated, info
 
     def reset(self) -> Tuple[torch.Tensor, Any]:
         """Reset the environment
@@ -284,8 +413,8 @@ class IsaacOrbitWrapper(Wrapper):
         :rtype: tuple of torch.Tensor and any other info
         """
         self._obs_dict, reward, terminated, info = self._env.step(actions)
-        truncated = torch.zeros_like(terminated)
-        return self._obs_dict["policy"], reward.view(-1, 1), terminated.view(-1, 1), truncated.view(-1, 1), info
+        reward, terminated, truncated = _reshape_isaac_step(reward, terminated)
+        return self._obs_dict["policy"], reward, terminated, truncated, info
 
     def reset(self) -> Tuple[torch.Tensor, Any]:
         """Reset the environment
@@ -316,11 +445,12 @@ class GymWrapper(Wrapper):
         :param env: The environment to wrap
         :type env: Any supported OpenAI Gym environment
         """
+        _load_gym()
         super().__init__(env)
 
         self._vectorized = False
         try:
-            if isinstance(env, gym.vector.SyncVectorEnv) or isinstance(env, gym.vector.AsyncVectorEnv):
+            if isinstance(env, gym.vector.VectorEnv):
                 self._vectorized = True
                 self._reset_once = True
                 self._obs_tensor = None
@@ -328,37 +458,60 @@ class GymWrapper(Wrapper):
         except Exception as e:
             print("[WARNING] Failed to check for a vectorized environment: {}".format(e))
 
+        # expose the per-environment spaces for vectorized environments
+        if self._vectorized:
+            self._state_space = self._env.single_observation_space
+            self._observation_space = self._env.single_observation_space
+            self._action_space = self._env.single_action_space
+        else:
+            self._state_space = self._observation_space
+
         self._drepecated_api = version.parse(gym.__version__) < version.parse(" 0.25.0")
         if self._drepecated_api:
             logger.warning("Using a deprecated version of OpenAI Gym's API: {}".format(gym.__version__))
 
-    @property
-    def state_space(self) -> gym.Space:
-        """State space
-
-        An alias for the ``observation_space`` property
-        """
-        if self._vectorized:
-            return self._env.single_observation_space
-        return self._env.observation_space
-
-    @property
-    def observation_space(self) -> gym.Space:
-        """Observation space
-        """
-        if self._vectorized:
-            return self._env.single_observation_space
-        return self._env.observation_space
-
-    @property
-    def action_space(self) -> gym.Space:
-        """Action space
-        """
+        # preallocate pinned staging buffers (CUDA only) to avoid a pageable-memory
+        # round-trip and a blocking copy on each observation transfer
+        self._obs_pin = None
+        if self.device.type == "cuda" and isinstance(self.observation_space, _Box):
+            size = self._num_envs * int(np.prod(self.observation_space.shape))
+            self._obs_pin = torch.empty(size, dtype=torch.float32, pin_memory=True)
+            self._obs_pin_np = self._obs_pin.numpy()
+
+        # fused staging buffer for the reward/terminated/truncated scalars (CUDA only),
+        # packed so the three values travel in a single transfer
+        self._rtt_pin = None
+        if self.device.type == "cuda":
+            self._rtt_pin = torch.empty(3, dtype=torch.float32, pin_memory=True)
+            self._rtt_dev = torch.empty(3, dtype=torch.float32, device=self.device)
+
+        # dedicated stream (with a completion event) so the host-to-device transfers
+        # overlap with the policy compute running on the default stream
+        self._copy_stream = None
+        if self.device.type == "cuda":
+            self._copy_stream = torch.cuda.Stream(device=self.device)
+            self._copy_event = torch.cuda.Event()
+
+        # specialize the action conversion once to avoid per-step isinstance dispatch
+        space = self._env.action_space if self._vectorized else self.action_space
         if self._vectorized:
-            return self._env.single_action_space
-        return self._env.action_space
-
-    def _observation_to_tensor(self, observation: Any, space: Optional[gym.Space] = None) -> torch.Tensor:
+            if isinstance(space, _MultiDiscrete):
+                self._action_dtype, self._action_shape = space.dtype, space.shape
+                self._tensor_to_action = self._box_tensor_to_action
+            elif isinstance(space, _Tuple):
+                if isinstance(space[0], _Box):
+                    self._action_dtype, self._action_shape = space[0].dtype, space.shape
+                    self._tensor_to_action = self._box_tensor_to_action
+                elif isinstance(space[0], _Discrete):
+                    self._action_dtype, self._action_shape = space[0].dtype, (-1,)
+                    self._tensor_to_action = self._box_tensor_to_action
+        elif isinstance(space, _Discrete):
+            self._tensor_to_action = self._discrete_tensor_to_action
+        elif isinstance(space, _Box):
+            self._action_dtype, self._action_shape = space.dtype, space.shape
+            self._tensor_to_action = self._box_tensor_to_action
+
+    def _observation_to_tensor(self, observation: Any, space: Optional["gym.Space"] = None) -> torch.Tensor:
         """Convert the OpenAI Gym observation to a flat tensor
 
         :param observation: The OpenAI Gym observation to convert to a tensor
@@ -372,26 +525,60 @@ class GymWrapper(Wrapper):
         observation_space = self._env.observation_space if self._vectorized else self.observation_space
         space = space if space is not None else observation_space
 
-        if self._vectorized and isinstance(space, gym.spaces.MultiDiscrete):
-            return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self.num_envs, -1)
+        if self._vectorized and isinstance(space, _MultiDiscrete):
+            # copy=True: vectorized envs reuse their result buffers in place, so the
+            # returned tensor must own its memory
+            return torch.from_numpy(np.ascontiguousarray(observation, dtype=np.int64)) \
+                .to(self.device, non_blocking=True, copy=True).view(self._num_envs, -1)
         elif isinstance(observation, int):
-            return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self.num_envs, -1)
+            return torch.as_tensor(observation, dtype=torch.int64, device=self.device).view(self._num_envs, -1)
         elif isinstance(observation, np.ndarray):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
-        elif isinstance(space, gym.spaces.Discrete):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
-        elif isinstance(space, gym.spaces.Box):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
-        elif isinstance(space, gym.spaces.Dict):
+            if self._obs_pin is not None and observation.size == self._obs_pin.numel():
+                # stage through pinned memory; .to() allocates a new owning device tensor,
+                # so tensors handed back by previous calls are never overwritten
+                np.copyto(self._obs_pin_np, observation.reshape(-1), casting="unsafe")
+                return self._obs_pin.to(self.device, non_blocking=True).view(self._num_envs, -1)
+            return torch.from_numpy(np.ascontiguousarray(observation, dtype=np.float32)) \
+                .to(self.device, non_blocking=True, copy=True).view(self._num_envs, -1)
+        elif isinstance(space, _Discrete):
+            return torch.as_tensor(observation, dtype=torch.float32).to(self.device, non_blocking=True) \
+                .view(self._num_envs, -1)
+        elif isinstance(space, _Box):
+            return torch.as_tensor(observation, dtype=torch.float32).to(self.device, non_blocking=True) \
+                .view(self._num_envs, -1)
+        elif isinstance(space, _Dict):
             tmp = torch.cat([self._observation_to_tensor(observation[k], space[k]) \
-                for k in sorted(space.keys())], dim=-1).view(self.num_envs, -1)
+                for k in sorted(space.keys())], dim=-1).view(self._num_envs, -1)
             return tmp
         else:
             raise ValueError("Observation space type {} not supported. Please report this issue".format(type(space)))
 
+    def _value_to_tensor(self, value: Any, dtype: torch.dtype) -> torch.Tensor:
+        """Convert a scalar or a numpy array returned by the environment to a tensor
+
+        Scalars are written directly on the device (device-side factory) while
+        numpy arrays are converted with a single owning copy
+
+        :param value: The value to convert
+        :type value: int, float, bool or np.ndarray
+        :param dtype: The data type of the resulting tensor
+        :type dtype: torch.dtype
+
+        :return: The value as a tensor of shape (num_envs, -1)
+        :rtype: torch.Tensor
+        """
+        if isinstance(value, np.ndarray):
+            # copy=True: the array may be a buffer the environment reuses in place
+            return torch.from_numpy(np.ascontiguousarray(value)) \
+                .to(self.device, dtype, non_blocking=True, copy=True).view(self._num_envs, -1)
+        return torch.full((self._num_envs, 1), value, device=self.device, dtype=dtype)
+
     def _tensor_to_action(self, actions: torch.Tensor) -> Any:
         """Convert the action to the OpenAI Gym expected format
 
+        This method is overridden (per instance) at instantiation time by one of
+        the specialized converters below, according to the environment action space
+
         :param actions: The actions to perform
         :type actions: torch.Tensor
 
@@ -401,21 +588,52 @@ class GymWrapper(Wrapper):
         :rtype: Any supported OpenAI Gym action space
         """
         space = self._env.action_space if self._vectorized else self.action_space
-
-        if self._vectorized:
-            if isinstance(space, gym.spaces.MultiDiscrete):
-                return np.array(actions.cpu().numpy(), dtype=space.dtype).reshape(space.shape)
-            elif isinstance(space, gym.spaces.Tuple):
-                if isinstance(space[0], gym.spaces.Box):
-                    return np.array(actions.cpu().numpy(), dtype=space[0].dtype).reshape(space.shape)
-                elif isinstance(space[0], gym.spaces.Discrete):
-                    return np.array(actions.cpu().numpy(), dtype=space[0].dtype).reshape(-1)
-        elif isinstance(space, gym.spaces.Discrete):
-            return actions.item()
-        elif isinstance(space, gym.spaces.Box):
-            return np.array(actions.cpu().numpy(), dtype=space.dtype).reshape(space.shape)
         raise ValueError("Action space type {} not supported. Please report this issue".format(type(space)))
 
+    def _discrete_tensor_to_action(self, actions: torch.Tensor) -> Any:
+        """Convert the action for a Discrete action space
+        """
+        return actions.item()
+
+    def _box_tensor_to_action(self, actions: torch.Tensor) -> Any:
+        """Convert the action for a Box-like (array) action space
+        """
+        # astype always copies, so the environment never receives a view of the tensor
+        return _to_numpy(actions).astype(self._action_dtype).reshape(self._action_shape)
+
+    def _convert_step_response(self, observation: Any, reward: Any, terminated: Any, truncated: Any) \
+            -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Convert the environment step response to tensors
+
+        :param observation: The observation returned by the environment
+        :type observation: Any supported OpenAI Gym observation space
+        :param reward: The reward returned by the environment
+        :type reward: int, float or np.ndarray
+        :param terminated: The termination flag returned by the environment
+        :type terminated: bool or np.ndarray
+        :param truncated: The truncation flag returned by the environment
+        :type truncated: bool or np.ndarray
+
+        :return: Observation, reward, terminated, truncated
+        :rtype: tuple of torch.Tensor
+        """
+        observation = self._observation_to_tensor(observation)
+        if self._rtt_pin is not None and not isinstance(reward, np.ndarray):
+            # pack the three scalars and issue a single host-to-device copy; the
+            # returned tensors are copies (the buffer is overwritten every step)
+            self._rtt_pin[0] = reward
+            self._rtt_pin[1] = float(terminated)
+            self._rtt_pin[2] = float(truncated)
+            self._rtt_dev.copy_(self._rtt_pin, non_blocking=True)
+            reward = self._rtt_dev[0:1].view(1, 1).clone()
+            terminated = self._rtt_dev[1:2].view(1, 1).to(torch.bool)
+            truncated = self._rtt_dev[2:3].view(1, 1).to(torch.bool)
+        else:
+            reward = self._value_to_tensor(reward, torch.float32)
+            terminated = self._value_to_tensor(terminated, torch.bool)
+            truncated = self._value_to_tensor(truncated, torch.bool)
+        return observation, reward, terminated, truncated
+
     def step(self, actions: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, Any]:
         """Perform a step in the environment
 
@@ -439,10 +657,19 @@ class GymWrapper(Wrapper):
             observation, reward, terminated, truncated, info = self._env.step(self._tensor_to_action(actions))
 
         # convert response to torch
-        observation = self._observation_to_tensor(observation)
-        reward = torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
-        terminated = torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
-        truncated = torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
+        if self._copy_stream is not None:
+            # reusing the staging buffers is only safe once the previous copies are done,
+            # and overwriting the device buffers must wait for their pending consumers
+            self._copy_event.synchronize()
+            self._copy_stream.wait_stream(torch.cuda.current_stream(self.device))
+            with torch.cuda.stream(self._copy_stream):
+                observation, reward, terminated, truncated = \
+                    self._convert_step_response(observation, reward, terminated, truncated)
+            self._copy_event.record(self._copy_stream)
+            torch.cuda.current_stream(self.device).wait_stream(self._copy_stream)
+        else:
+            observation, reward, terminated, truncated = \
+                self._convert_step_response(observation, reward, terminated, truncated)
 
         # save observation and info for vectorized envs
         if self._vectorized:
@@ -469,7 +696,18 @@ class GymWrapper(Wrapper):
             info = {}
         else:
             observation, info = self._env.reset()
-        return self._observation_to_tensor(observation), info
+
+        # convert response to torch (same stream/event discipline as step)
+        if self._copy_stream is not None:
+            self._copy_event.synchronize()
+            self._copy_stream.wait_stream(torch.cuda.current_stream(self.device))
+            with torch.cuda.stream(self._copy_stream):
+                observation = self._observation_to_tensor(observation)
+            self._copy_event.record(self._copy_stream)
+            torch.cuda.current_stream(self.device).wait_stream(self._copy_stream)
+        else:
+            observation = self._observation_to_tensor(observation)
+        return observation, info
 
     def render(self, *args, **kwargs) -> None:
         """Render the environment
@@ -482,6 +720,35 @@ class GymWrapper(Wrapper):
         self._env.close()
 
 
+class VectorGymWrapper(GymWrapper):
+    """Vectorized OpenAI Gym environment wrapper
+
+    Specialization of the Gym wrapper for ``gym.vector.VectorEnv`` environments.
+    Observations arrive as a single batched numpy array, so they are transferred
+    to the device as a whole instead of going through the per-space dispatch
+    """
+    def _observation_to_tensor(self, observation: Any, space: Optional["gym.Space"] = None) -> torch.Tensor:
+        """Convert the batched OpenAI Gym observation to a flat tensor
+
+        :param observation: The OpenAI Gym observation to convert to a tensor
+        :type observation: Any supported OpenAI Gym observation space
+
+        :raises: ValueError if the observation space type is not supported
+
+        :return: The observation as a flat tensor
+        :rtype: torch.Tensor
+        """
+        # only Box observations are float32 batches; integer spaces (e.g. batched
+        # Discrete, i.e. MultiDiscrete) must keep the per-space dispatch and dtype
+        if space is None and isinstance(observation, np.ndarray) and isinstance(self.observation_space, _Box):
+            if self._obs_pin is not None and observation.size == self._obs_pin.numel():
+                np.copyto(self._obs_pin_np, observation.reshape(-1), casting="unsafe")
+                return self._obs_pin.to(self.device, non_blocking=True).view(self._num_envs, -1)
+            return torch.from_numpy(np.ascontiguousarray(observation, dtype=np.float32)) \
+                .to(self.device, non_blocking=True, copy=True).view(self._num_envs, -1)
+        return super()._observation_to_tensor(observation, space)
+
+
 class GymnasiumWrapper(Wrapper):
     def __init__(self, env: Any) -> None:
         """Gymnasium environment wrapper
@@ -489,6 +756,7 @@ class GymnasiumWrapper(Wrapper):
         :param env: The environment to wrap
         :type env: Any supported Gymnasium environment
         """
+        _load_gymnasium()
         super().__init__(env)
 
         self._vectorized = False
@@ -501,33 +769,15 @@ class GymnasiumWrapper(Wrapper):
         except Exception as e:
             print("[WARNING] Failed to check for a vectorized environment: {}".format(e))
 
-    @property
-    def state_space(self) -> gymnasium.Space:
-        """State space
-
-        An alias for the ``observation_space`` property
-        """
-        if self._vectorized:
-            return self._env.single_observation_space
-        return self._env.observation_space
-
-    @property
-    def observation_space(self) -> gymnasium.Space:
-        """Observation space
-        """
-        if self._vectorized:
-            return self._env.single_observation_space
-        return self._env.observation_space
-
-    @property
-    def action_space(self) -> gymnasium.Space:
-        """Action space
-        """
+        # expose the per-environment spaces for vectorized environments
         if self._vectorized:
-            return self._env.single_action_space
-        return self._env.action_space
+            self._state_space = self._env.single_observation_space
+            self._observation_space = self._env.single_observation_space
+            self._action_space = self._env.single_action_space
+        else:
+            self._state_space = self._observation_space
 
-    def _observation_to_tensor(self, observation: Any, space: Optional[gymnasium.Space] = None) -> torch.Tensor:
+    def _observation_to_tensor(self, observation: Any, space: Optional["gymnasium.Space"] = None) -> torch.Tensor:
         """Convert the Gymnasium observation to a flat tensor
 
         :param observation: The Gymnasium observation to convert to a tensor
@@ -542,18 +792,18 @@ class GymnasiumWrapper(Wrapper):
         space = space if space is not None else observation_space
 
         if self._vectorized and isinstance(space, gymnasium.spaces.MultiDiscrete):
-            return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self.num_envs, -1)
+            return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self._num_envs, -1)
         elif isinstance(observation, int):
-            return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self.num_envs, -1)
+            return torch.tensor(observation, device=self.device, dtype=torch.int64).view(self._num_envs, -1)
         elif isinstance(observation, np.ndarray):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
+            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self._num_envs, -1)
         elif isinstance(space, gymnasium.spaces.Discrete):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
+            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self._num_envs, -1)
         elif isinstance(space, gymnasium.spaces.Box):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
+            return torch.tensor(observation, device=self.device, dtype=torch.float32).view(self._num_envs, -1)
         elif isinstance(space, gymnasium.spaces.Dict):
             tmp = torch.cat([self._observation_to_tensor(observation[k], space[k]) \
-                for k in sorted(space.keys())], dim=-1).view(self.num_envs, -1)
+                for k in sorted(space.keys())], dim=-1).view(self._num_envs, -1)
             return tmp
         else:
             raise ValueError("Observation space type {} not supported. Please report this issue".format(type(space)))
@@ -598,9 +848,9 @@ class GymnasiumWrapper(Wrapper):
 
         # convert response to torch
         observation = self._observation_to_tensor(observation)
-        reward = torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1)
-        terminated = torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
-        truncated = torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1)
+        reward = torch.tensor(reward, device=self.device, dtype=torch.float32).view(self._num_envs, -1)
+        terminated = torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self._num_envs, -1)
+        truncated = torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self._num_envs, -1)
 
         # save observation and info for vectorized envs
         if self._vectorized:
@@ -643,6 +893,7 @@ class DeepMindWrapper(Wrapper):
         :param env: The environment to wrap
         :type env: Any supported DeepMind environment
         """
+        _load_gym()  # the DeepMind specs are exposed as gym spaces
         super().__init__(env)
 
         from dm_env import specs
@@ -651,28 +902,42 @@ class DeepMindWrapper(Wrapper):
         # observation and action spaces
         self._observation_space = self._spec_to_space(self._env.observation_spec())
         self._action_space = self._spec_to_space(self._env.action_spec())
-
-    @property
-    def state_space(self) -> gym.Space:
-        """State space
-
-        An alias for the ``observation_space`` property
-        """
-        return self._observation_space
-
-    @property
-    def observation_space(self) -> gym.Space:
-        """Observation space
-        """
-        return self._observation_space
-
-    @property
-    def action_space(self) -> gym.Space:
-        """Action space
-        """
-        return self._action_space
-
-    def _spec_to_space(self, spec: Any) -> gym.Space:
+        self._state_space = self._observation_space
+
+        # "compile" the observation spec into a flat plan of (path, offset, size)
+        # leaves and preallocate a single staging buffer (pinned on CUDA), so each
+        # step only iterates the plan: no type dispatch, recursion or sorting
+        self._obs_plan = []
+        offset = 0
+        leaf_dtypes = set()
+        for path, spec in self._flatten_spec(self._env.observation_spec()):
+            size = int(np.prod(spec.shape))
+            self._obs_plan.append((path, offset, size))
+            leaf_dtypes.add(np.dtype(spec.dtype))
+            offset += size
+        self._obs_stage = torch.empty(offset, dtype=torch.float32,
+                                      pin_memory=self.device.type == "cuda")
+        self._obs_stage_np = self._obs_stage.numpy()
+
+        # JIT-compile the flatten loop with numba when available (soft dependency).
+        # The leaves must share a dtype so they can be passed as a typed tuple
+        self._use_numba = numba is not None and len(leaf_dtypes) == 1
+        if self._use_numba:
+            self._obs_offsets = np.array([offset for _, offset, _ in self._obs_plan], dtype=np.int64)
+            self._obs_sizes = np.array([size for _, _, size in self._obs_plan], dtype=np.int64)
+
+        # cache the action spec properties so the conversion is a single pass
+        self._action_spec = self._env.action_spec()
+        if isinstance(self._action_spec, self._specs.DiscreteArray):
+            self._discrete_action_np = np.empty((), dtype=self._action_spec.dtype)
+        elif isinstance(self._action_spec, self._specs.Array):  # includes BoundedArray
+            self._action_shape = self._action_spec.shape
+            # persistent output buffer: the torch view shares memory with the numpy
+            # array, so one copy_ fills it without per-step allocations
+            self._action_np = np.empty(self._action_spec.shape, dtype=self._action_spec.dtype)
+            self._action_buf = torch.from_numpy(self._action_np)
+
+    def _spec_to_space(self, spec: Any) -> "gym.Space":
         """Convert the DeepMind spec to a Gym space
 
         :param spec: The DeepMind spec to convert
@@ -684,44 +949,74 @@ class DeepMindWrapper(Wrapper):
         :rtype: gym.Space
         """
         if isinstance(spec, self._specs.DiscreteArray):
-            return gym.spaces.Discrete(spec.num_values)
+            return _Discrete(spec.num_values)
         elif isinstance(spec, self._specs.BoundedArray):
-            return gym.spaces.Box(shape=spec.shape,
-                                  dtype=spec.dtype,
-                                  low=spec.minimum if spec.minimum.ndim else np.full(spec.shape, spec.minimum),
-                                  high=spec.maximum if spec.maximum.ndim else np.full(spec.shape, spec.maximum))
+            return _Box(shape=spec.shape,
+                        dtype=spec.dtype,
+                        low=spec.minimum if spec.minimum.ndim else np.full(spec.shape, spec.minimum),
+                        high=spec.maximum if spec.maximum.ndim else np.full(spec.shape, spec.maximum))
         elif isinstance(spec, self._specs.Array):
-            return gym.spaces.Box(shape=spec.shape,
-                                  dtype=spec.dtype,
-                                  low=np.full(spec.shape, float("-inf")),
-                                  high=np.full(spec.shape, float("inf")))
-        elif isinstance(spec, collections.OrderedDict):
-            return gym.spaces.Dict({k: self._spec_to_space(v) for k, v in spec.items()})
+            return _Box(shape=spec.shape,
+                        dtype=spec.dtype,
+                        low=np.full(spec.shape, float("-inf")),
+                        high=np.full(spec.shape, float("inf")))
+        elif isinstance(spec, dict):
+            return _Dict({k: self._spec_to_space(v) for k, v in spec.items()})
         else:
             raise ValueError("Spec type {} not supported. Please report this issue".format(type(spec)))
 
-    def _observation_to_tensor(self, observation: Any, spec: Optional[Any] = None) -> torch.Tensor:
+    def _flatten_spec(self, spec: Any, path: Tuple[str, ...] = ()) -> Any:
+        """Walk the observation spec depth-first, yielding its (path, leaf spec) pairs
+
+        :param spec: The DeepMind spec to flatten
+        :type spec: Any supported DeepMind spec
+        :param path: The dictionary keys leading to the spec (default: ())
+        :type path: tuple of str, optional
+
+        :raises: ValueError if the spec type is not supported
+
+        :return: Generator of (path, leaf spec) pairs
+        :rtype: generator
+        """
+        if isinstance(spec, dict):
+            for key in sorted(spec.keys()):
+                yield from self._flatten_spec(spec[key], path + (key,))
+        elif isinstance(spec, self._specs.Array):  # includes BoundedArray and DiscreteArray
+            yield path, spec
+        else:
+            raise ValueError("Observation spec type {} not supported. Please report this issue".format(type(spec)))
+
+    def _observation_to_tensor(self, observation: Any) -> torch.Tensor:
         """Convert the DeepMind observation to a flat tensor
 
+        The observation is flattened following the plan precomputed at
+        instantiation, filling a single staging buffer leaf by leaf and issuing
+        one copy to the device
+
         :param observation: The DeepMind observation to convert to a tensor
         :type observation: Any supported DeepMind observation
 
-        :raises: ValueError if the observation spec type is not supported
-
         :return: The observation as a flat tensor
         :rtype: torch.Tensor
         """
-        spec = spec if spec is not None else self._env.observation_spec()
-
-        if isinstance(spec, self._specs.DiscreteArray):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).reshape(self.num_envs, -1)
-        elif isinstance(spec, self._specs.Array):  # includes BoundedArray
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).reshape(self.num_envs, -1)
-        elif isinstance(spec, collections.OrderedDict):
-            return torch.cat([self._observation_to_tensor(observation[k], spec[k]) \
-                for k in sorted(spec.keys())], dim=-1).reshape(self.num_envs, -1)
+        if self._use_numba:
+            leaves = []
+            for path, _, _ in self._obs_plan:
+                leaf = observation
+                for key in path:
+                    leaf = leaf[key]
+                leaves.append(np.ascontiguousarray(leaf).reshape(-1))
+            _flatten_leaves(self._obs_stage_np, tuple(leaves), self._obs_offsets, self._obs_sizes)
         else:
-            raise ValueError("Observation spec type {} not supported. Please report this issue".format(type(spec)))
+            for path, offset, size in self._obs_plan:
+                leaf = observation
+                for key in path:
+                    leaf = leaf[key]
+                np.copyto(self._obs_stage_np[offset:offset + size],
+                          np.asarray(leaf).reshape(-1), casting="unsafe")
+        # copy=True so the returned tensor owns its memory (also on CPU, where the
+        # staging buffer itself is refilled on every call)
+        return self._obs_stage.to(self.device, non_blocking=True, copy=True).view(self._num_envs, -1)
 
     def _tensor_to_action(self, actions: torch.Tensor) -> Any:
         """Convert the action to the DeepMind expected format
@@ -734,12 +1029,16 @@ class DeepMindWrapper(Wrapper):
         :return: The action in the DeepMind expected format
         :rtype: Any supported DeepMind action
         """
-        spec = self._env.action_spec()
+        spec = self._action_spec
 
         if isinstance(spec, self._specs.DiscreteArray):
-            return np.array(actions.item(), dtype=spec.dtype)
+            self._discrete_action_np[()] = actions.item()
+            return self._discrete_action_np
         elif isinstance(spec, self._specs.Array):  # includes BoundedArray
-            return np.array(actions.cpu().numpy(), dtype=spec.dtype).reshape(spec.shape)
+            # a single copy (with dtype cast) into the persistent buffer; the
+            # environment consumes the action synchronously, so reuse is safe
+            self._action_buf.copy_(actions.detach().reshape(self._action_shape))
+            return self._action_np
         else:
             raise ValueError("Action spec type {} not supported. Please report this issue".format(type(spec)))
 
@@ -760,11 +1059,11 @@ class DeepMindWrapper(Wrapper):
         truncated = False
         info = {}
 
-        # convert response to torch
+        # convert response to torch (device-side factories: no host staging for scalars)
         return self._observation_to_tensor(observation), \
-               torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1), \
-               torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1), \
-               torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1), \
+               torch.full((self._num_envs, 1), reward, device=self.device, dtype=torch.float32), \
+               torch.full((self._num_envs, 1), terminated, device=self.device, dtype=torch.bool), \
+               torch.full((self._num_envs, 1), truncated, device=self.device, dtype=torch.bool), \
                info
 
     def reset(self) -> Tuple[torch.Tensor, Any]:
@@ -802,33 +1101,15 @@ class RobosuiteWrapper(Wrapper):
         :param env: The environment to wrap
         :type env: Any supported robosuite environment
         """
+        _load_gym()  # the robosuite specs are exposed as gym spaces
         super().__init__(env)
 
         # observation and action spaces
         self._observation_space = self._spec_to_space(self._env.observation_spec())
         self._action_space = self._spec_to_space(self._env.action_spec)
+        self._state_space = self._observation_space
 
-    @property
-    def state_space(self) -> gym.Space:
-        """State space
-
-        An alias for the ``observation_space`` property
-        """
-        return self._observation_space
-
-    @property
-    def observation_space(self) -> gym.Space:
-        """Observation space
-        """
-        return self._observation_space
-
-    @property
-    def action_space(self) -> gym.Space:
-        """Action space
-        """
-        return self._action_space
-
-    def _spec_to_space(self, spec: Any) -> gym.Space:
+    def _spec_to_space(self, spec: Any) -> "gym.Space":
         """Convert the robosuite spec to a Gym space
 
         :param spec: The robosuite spec to convert
@@ -840,17 +1121,17 @@ class RobosuiteWrapper(Wrapper):
         :rtype: gym.Space
         """
         if type(spec) is tuple:
-            return gym.spaces.Box(shape=spec[0].shape,
-                                  dtype=np.float32,
-                                  low=spec[0],
-                                  high=spec[1])
+            return _Box(shape=spec[0].shape,
+                        dtype=np.float32,
+                        low=spec[0],
+                        high=spec[1])
         elif isinstance(spec, np.ndarray):
-            return gym.spaces.Box(shape=spec.shape,
-                                  dtype=np.float32,
-                                  low=np.full(spec.shape, float("-inf")),
-                                  high=np.full(spec.shape, float("inf")))
-        elif isinstance(spec, collections.OrderedDict):
-            return gym.spaces.Dict({k: self._spec_to_space(v) for k, v in spec.items()})
+            return _Box(shape=spec.shape,
+                        dtype=np.float32,
+                        low=np.full(spec.shape, float("-inf")),
+                        high=np.full(spec.shape, float("inf")))
+        elif isinstance(spec, dict):
+            return _Dict({k: self._spec_to_space(v) for k, v in spec.items()})
         else:
             raise ValueError("Spec type {} not supported. Please report this issue".format(type(spec)))
 
@@ -868,10 +1149,10 @@ class RobosuiteWrapper(Wrapper):
         spec = spec if spec is not None else self._env.observation_spec()
 
         if isinstance(spec, np.ndarray):
-            return torch.tensor(observation, device=self.device, dtype=torch.float32).reshape(self.num_envs, -1)
-        elif isinstance(spec, collections.OrderedDict):
+            return torch.tensor(observation, device=self.device, dtype=torch.float32).reshape(self._num_envs, -1)
+        elif isinstance(spec, dict):
             return torch.cat([self._observation_to_tensor(observation[k], spec[k]) \
-                for k in sorted(spec.keys())], dim=-1).reshape(self.num_envs, -1)
+                for k in sorted(spec.keys())], dim=-1).reshape(self._num_envs, -1)
         else:
             raise ValueError("Observation spec type {} not supported. Please report this issue".format(type(spec)))
 
@@ -908,9 +1189,9 @@ class RobosuiteWrapper(Wrapper):
 
         # convert response to torch
         return self._observation_to_tensor(observation), \
-               torch.tensor(reward, device=self.device, dtype=torch.float32).view(self.num_envs, -1), \
-               torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self.num_envs, -1), \
-               torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self.num_envs, -1), \
+               torch.tensor(reward, device=self.device, dtype=torch.float32).view(self._num_envs, -1), \
+               torch.tensor(terminated, device=self.device, dtype=torch.bool).view(self._num_envs, -1), \
+               torch.tensor(truncated, device=self.device, dtype=torch.bool).view(self._num_envs, -1), \
                info
 
     def reset(self) -> Tuple[torch.Tensor, Any]:
@@ -987,18 +1268,25 @@ def wrap_env(env: Any, wrapper: str = "auto", verbose: bool = True) -> Wrapper:
         logger.info("Environment class: {}".format(", ".join([str(base).replace("<class '", "").replace("'>", "") \
             for base in env.__class__.__bases__])))
     if wrapper == "auto":
-        base_classes = [str(base) for base in env.__class__.__bases__]
-        if "<class 'omni.isaac.gym.vec_env.vec_env_base.VecEnvBase'>" in base_classes or \
-            "<class 'omni.isaac.gym.vec_env.vec_env_mt.VecEnvMT'>" in base_classes:
+        if _is_instance(env, "omni.isaac.gym.vec_env.vec_env_base.VecEnvBase") or \
+            _is_instance(env, "omni.isaac.gym.vec_env.vec_env_mt.VecEnvMT"):
             if verbose:
                 logger.info("Environment wrapper: Omniverse Isaac Gym")
             return OmniverseIsaacGymWrapper(env)
-        elif isinstance(env, gym.core.Env) or isinstance(env, gym.core.Wrapper):
+        # gym/gymnasium are only needed from this point on
+        _load_gym()
+        _load_gymnasium()
+        if isinstance(env, gym.core.Env) or isinstance(env, gym.core.Wrapper):
             # isaac-orbit
             if hasattr(env, "sim") and hasattr(env, "env_ns"):
                 if verbose:
                     logger.info("Environment wrapper: Isaac Orbit")
                 return IsaacOrbitWrapper(env)
+            # vectorized gym
+            if hasattr(gym, "vector") and isinstance(env, gym.vector.VectorEnv):
+                if verbose:
+                    logger.info("Environment wrapper: Vectorized Gym")
+                return VectorGymWrapper(env)
             # gym
             if verbose:
                 logger.info("Environment wrapper: Gym")
@@ -1007,15 +1295,15 @@ def wrap_env(env: Any, wrapper: str = "auto", verbose: bool = True) -> Wrapper:
             if verbose:
                 logger.info("Environment wrapper: Gymnasium")
             return GymnasiumWrapper(env)
-        elif "<class 'dm_env._environment.Environment'>" in base_classes:
+        elif _is_instance(env, "dm_env._environment.Environment"):
             if verbose:
                 logger.info("Environment wrapper: DeepMind")
             return DeepMindWrapper(env)
-        elif "<class 'robosuite.environments." in base_classes[0]:
+        elif _is_instance(env, "robosuite.environments.base.MujocoEnv"):
             if verbose:
                 logger.info("Environment wrapper: Robosuite")
             return RobosuiteWrapper(env)
-        elif "<class 'rlgpu.tasks.base.vec_task.VecTask'>" in base_classes:
+        elif _is_instance(env, "rlgpu.tasks.base.vec_task.VecTask"):
             if verbose:
                 logger.info("Environment wrapper: Isaac Gym (preview 2)")
             return IsaacGymPreview2Wrapper(env)
@@ -34,3 +34,51 @@ def test_wrap_env(capsys, classes_and_kwargs, wrapper):
     env.state_space
     env.num_envs
     env.device
+
+
+def test_wrap_env_vectorized_gym(capsys, classes_and_kwargs):
+    gym = pytest.importorskip("gym")
+    import numpy as np
+
+    from skrl.envs.torch.wrappers import VectorGymWrapper
+
+    class DummyVectorEnv(gym.vector.VectorEnv):
+        def __init__(self, num_envs, observation_space, action_space, observations):
+            super().__init__(num_envs, observation_space, action_space)
+            self._observations = observations
+
+        def reset(self, **kwargs):
+            return self._observations, {}
+
+        def step(self, actions):
+            # reuse the observation buffer in place, as gym.vector.SyncVectorEnv does
+            self._observations += 1
+            rewards = np.zeros(self.num_envs, dtype=np.float32)
+            terminateds = np.zeros(self.num_envs, dtype=bool)
+            truncateds = np.zeros(self.num_envs, dtype=bool)
+            return self._observations, rewards, terminateds, truncateds, {}
+
+    # Box observations are transferred as a single float32 batch
+    env = wrap_env(env=DummyVectorEnv(2, gym.spaces.Box(low=-1, high=1, shape=(2,)), gym.spaces.Discrete(2),
+                                      np.zeros((2, 2), dtype=np.float32)), wrapper="auto")
+    assert isinstance(env, VectorGymWrapper)
+
+    observation, info = env.reset()
+    observation, reward, terminated, truncated, info = env.step(torch.zeros((2, 1)))
+    assert observation.dtype == torch.float32
+
+    # the returned tensors must own their memory: a previously returned
+    # observation keeps its values when the environment buffer is overwritten
+    previous_observation = observation
+    observation, reward, terminated, truncated, info = env.step(torch.zeros((2, 1)))
+    assert previous_observation.data_ptr() != observation.data_ptr()
+    assert torch.all(previous_observation == 1) and torch.all(observation == 2)
+
+    # batched Discrete observations (MultiDiscrete) must stay integer tensors
+    env = wrap_env(env=DummyVectorEnv(2, gym.spaces.Discrete(3), gym.spaces.Discrete(2),
+                                      np.zeros(2, dtype=np.int64)), wrapper="auto")
+    assert isinstance(env, VectorGymWrapper)
+
+    observation, info = env.reset()
+    observation, reward, terminated, truncated, info = env.step(torch.zeros((2, 1)))
+    assert observation.dtype == torch.int64